@@ -158,7 +158,8 @@ cat > /tmp/lambda-s3-policy.json << EOF
         "sns:TagResource",
         "sns:ListTagsForResource",
         "sqs:TagQueue",
-        "sqs:ListQueueTags"
+        "sqs:ListQueueTags",
+        "tag:TagResources"
       ],
       "Resource": "*"
     }
@@ -1,18 +1,51 @@
 """CloudTrail event parser for extracting resource information."""
 
+import functools
 import json
 import logging
-from typing import Dict, List, Optional
+import sys
+import textwrap
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Optional
 from datetime import datetime
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 
+class ParsedEvent(NamedTuple):
+    """Resource information extracted from one CloudTrail event."""
+
+    user_arn: str
+    event_name: str
+    service: str
+    resource_type: str
+    resource_ids: List[str]
+    event_time: Optional[str]
+    region: Optional[str]
+
+
+@functools.lru_cache(maxsize=256)
+def _root_arn(account_id: str) -> str:
+    """Build the root user ARN for an account."""
+    return f"arn:aws:iam::{account_id}:root"
+
+
+def _intern_mapping(mapping: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Intern event names and freeze each id_path into a tuple of interned keys."""
+    return {
+        sys.intern(event_name): {
+            **resource_mapping,
+            "id_path": tuple(sys.intern(part) for part in resource_mapping["id_path"]),
+            "id_key": sys.intern(resource_mapping["id_key"]) if resource_mapping["id_key"] else None,
+        }
+        for event_name, resource_mapping in mapping.items()
+    }
+
+
 class CloudTrailParser:
     """Parse CloudTrail events to extract resource IDs and user info."""
 
-    EVENT_RESOURCE_MAPPING = {
+    _RAW_EVENT_RESOURCE_MAPPING = {
         "RunInstances": {
             "service": "ec2",
             "resource_type": "instance",
@@ -93,35 +126,38 @@ class CloudTrailParser:
         },
     }
 
+    # Event names are interned so lookups against them can short-circuit on identity.
+    EVENT_RESOURCE_MAPPING = _intern_mapping(_RAW_EVENT_RESOURCE_MAPPING)
+
     @staticmethod
-    def parse_event(event: Dict) -> Optional[Dict]:
+    def parse_event(event: Dict) -> Optional[ParsedEvent]:
         """Parse CloudTrail event and extract resource information."""
         try:
             detail = event.get("detail", {})
             
-            user_arn = CloudTrailParser._extract_user_arn(detail)
-            if not user_arn:
+            event_name = detail.get("eventName")
+            resource_mapping = CloudTrailParser.EVENT_RESOURCE_MAPPING.get(event_name)
+            if resource_mapping is None:
                 return None
             
-            event_name = detail.get("eventName")
-            if not event_name or event_name not in CloudTrailParser.EVENT_RESOURCE_MAPPING:
+            user_arn = CloudTrailParser._extract_user_arn(detail)
+            if not user_arn:
                 return None
             
-            resource_mapping = CloudTrailParser.EVENT_RESOURCE_MAPPING[event_name]
-            resource_ids = CloudTrailParser._extract_resource_ids(detail, resource_mapping)
+            resource_ids = CloudTrailParser._EXTRACTORS[event_name](detail)
             
             if not resource_ids:
                 return None
             
-            return {
-                "user_arn": user_arn,
-                "event_name": event_name,
-                "service": resource_mapping["service"],
-                "resource_type": resource_mapping["resource_type"],
-                "resource_ids": resource_ids,
-                "event_time": detail.get("eventTime"),
-                "region": detail.get("awsRegion"),
-            }
+            return ParsedEvent(
+                user_arn=user_arn,
+                event_name=event_name,
+                service=resource_mapping["service"],
+                resource_type=resource_mapping["resource_type"],
+                resource_ids=resource_ids,
+                event_time=detail.get("eventTime"),
+                region=detail.get("awsRegion"),
+            )
             
         except Exception as e:
             logger.error(f"Parse error: {str(e)}")
@@ -136,53 +172,61 @@ class CloudTrailParser:
         if arn:
             return arn
         
-        account_id = user_identity.get("accountId")
-        if account_id and user_identity.get("type") == "Root":
-            return f"arn:aws:iam::{account_id}:root"
-        
-        principal_id = user_identity.get("principalId")
-        if principal_id:
-            return principal_id
+        if user_identity.get("type") == "Root":
+            account_id = user_identity.get("accountId")
+            if account_id:
+                return _root_arn(account_id)
         
-        return None
-
-    @staticmethod
-    def _extract_resource_ids(detail: Dict, resource_mapping: Dict) -> List[str]:
-        """Extract resource IDs using configured path."""
-        id_path = resource_mapping["id_path"]
-        id_key = resource_mapping["id_key"]
-        
-        try:
-            current = detail
-            for path_part in id_path[:-1]:
-                if isinstance(current, dict):
-                    current = current.get(path_part, {})
-                elif isinstance(current, list) and isinstance(path_part, int):
-                    current = current[path_part]
-                else:
-                    return []
-            
-            final_key = id_path[-1]
-            value = current.get(final_key) if isinstance(current, dict) else current
-            
+        return user_identity.get("principalId") or None
+
+    # Extractor templates, specialized per mapping entry by _compile_extractors.
+    _LIST_EXTRACTOR_TEMPLATE = textwrap.dedent("""
+        def extract(detail):
+            try:
+                value = detail{path}
+            except (KeyError, TypeError, IndexError):
+                return []
+            if isinstance(value, list):
+                return [item[{id_key!r}] for item in value if isinstance(item, dict) and item.get({id_key!r})]
+            return [value] if value else []
+    """)
+
+    _VALUE_EXTRACTOR_TEMPLATE = textwrap.dedent("""
+        def extract(detail):
+            try:
+                value = detail{path}
+            except (KeyError, TypeError, IndexError):
+                return []
             if isinstance(value, list):
-                if id_key:
-                    return [item.get(id_key) for item in value if isinstance(item, dict) and item.get(id_key)]
                 return [item for item in value if item]
-            elif value:
-                return [value]
-            
-            return []
-            
-        except Exception as e:
-            logger.error(f"ID extraction error: {str(e)}")
-            return []
+            return [value] if value else []
+    """)
+
+    _EXTRACTORS: Dict[str, Callable[[Dict], List[str]]] = {}
+
+    @classmethod
+    def _compile_extractors(cls) -> Dict[str, Callable[[Dict], List[str]]]:
+        """Compile each configured id_path into a direct lookup function."""
+        extractors = {}
+        for event_name, resource_mapping in cls.EVENT_RESOURCE_MAPPING.items():
+            id_key = resource_mapping["id_key"]
+            template = cls._LIST_EXTRACTOR_TEMPLATE if id_key else cls._VALUE_EXTRACTOR_TEMPLATE
+            path = "".join(f"[{part!r}]" for part in resource_mapping["id_path"])
+            namespace = {}
+            exec(template.format(path=path, id_key=id_key), namespace)
+            extractors[event_name] = namespace["extract"]
+        return extractors
 
     @staticmethod
     def is_supported_event(event_name: str) -> bool:
-        return event_name in CloudTrailParser.EVENT_RESOURCE_MAPPING
+        return event_name in SUPPORTED_EVENTS
 
     @staticmethod
     def get_supported_events() -> List[str]:
         return list(CloudTrailParser.EVENT_RESOURCE_MAPPING.keys())
 
+
+CloudTrailParser._EXTRACTORS = CloudTrailParser._compile_extractors()
+
+# CloudTrail event names the parser can extract resources from.
+SUPPORTED_EVENTS: FrozenSet[str] = frozenset(CloudTrailParser.EVENT_RESOURCE_MAPPING)
@@ -3,73 +3,123 @@
 import json
 import logging
 import os
-from typing import Dict, Any
-from cloudtrail_parser import CloudTrailParser
-from tag_manager import TagManager
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from cloudtrail_parser import CloudTrailParser, ParsedEvent
+from tag_manager import TagManager, created_date_now
 from s3_cloudtrail_processor import S3CloudTrailProcessor
 
+try:
+    import orjson
+
+    def _to_json(payload: Any) -> str:
+        return orjson.dumps(payload).decode()
+except ImportError:
+    _to_json = json.dumps
+
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Reused across warm invocations so boto3 clients are built once per container.
+_TAG_MANAGER: Optional[TagManager] = None
+_S3_PROCESSOR: Optional[S3CloudTrailProcessor] = None
+
+_LAMBDA_REGION = os.environ.get("AWS_REGION", "us-east-1")
+
+# Build the most used tagging clients during Lambda's init phase rather than on the first event.
+TagManager.preload(("ec2", "s3"), _LAMBDA_REGION)
+
+# Tags that are the same for every event handled by this container.
+_ENVIRONMENT = os.environ.get("ENVIRONMENT")
+_BASE_TAGS: Dict[str, str] = {"Environment": _ENVIRONMENT} if _ENVIRONMENT else {}
+
+# Tagging groups are independent, network-bound AWS calls, so they run concurrently.
+_TAG_EXECUTOR = ThreadPoolExecutor(max_workers=int(os.environ.get("TAG_PARALLELISM", "8")))
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Process S3 CloudTrail logs and tag resources."""
     try:
         if not S3CloudTrailProcessor.is_s3_event(event):
-            return {"statusCode": 400, "body": json.dumps({"error": "Invalid event type"})}
+            return {"statusCode": 400, "body": _to_json({"error": "Invalid event type"})}
         
         return handle_s3_event(event)
         
     except Exception as e:
-        logger.error(f"Error: {str(e)}", exc_info=True)
-        return {"statusCode": 500, "body": json.dumps({"error": str(e)})}
+        logger.error("Error: %s", e, exc_info=True)
+        return {"statusCode": 500, "body": _to_json({"error": str(e)})}
 
 
 def handle_s3_event(s3_event: Dict[str, Any]) -> Dict[str, Any]:
     """Process CloudTrail logs from S3."""
-    processor = S3CloudTrailProcessor()
+    processor = _get_s3_processor()
     cloudtrail_events = processor.process_s3_event(s3_event)
+    groups, events_processed = _group_events(cloudtrail_events)
     
-    if not cloudtrail_events:
-        return {"statusCode": 200, "body": json.dumps({"events_processed": 0})}
+    if not events_processed:
+        return {"statusCode": 200, "body": _to_json({"events_processed": 0})}
     
-    logger.info(f"Processing {len(cloudtrail_events)} events")
+    logger.info("Processing %d events in %d groups", events_processed, len(groups))
     
-    results = []
-    for event in cloudtrail_events:
-        result = process_single_event(event)
-        if result:
-            results.append(result)
+    # Create the shared TagManager before fanning out to worker threads.
+    _get_tag_manager()
+    # One CreatedDate for every resource created in this batch of log files.
+    created_date = created_date_now()
+    futures = [
+        _TAG_EXECUTOR.submit(_tag_group, group_key, resource_ids, created_date)
+        for group_key, resource_ids in groups.items()
+    ]
+    results = [future.result() for future in as_completed(futures)]
     
     total_tagged = sum(r.get('tagged_count', 0) for r in results)
     total_failed = sum(r.get('failed_count', 0) for r in results)
     
     return {
         "statusCode": 200,
-        "body": json.dumps({
-            "events_processed": len(cloudtrail_events),
+        "body": _to_json({
+            "events_processed": events_processed,
             "total_tagged": total_tagged,
             "total_failed": total_failed
         })
     }
 
 
-def process_single_event(event: Dict[str, Any]) -> Dict[str, Any]:
-    """Process and tag resources from a single CloudTrail event."""
-    parsed_event = CloudTrailParser.parse_event(event)
-    if not parsed_event:
-        return None
-    
-    user_arn = parsed_event["user_arn"]
-    service = parsed_event["service"]
-    resource_type = parsed_event["resource_type"]
-    resource_ids = parsed_event["resource_ids"]
-    resource_region = parsed_event.get("region")
+def _group_key(parsed_event: ParsedEvent, event: Dict[str, Any]) -> Tuple:
+    """Build the key under which events can share one tagging call."""
+    return (
+        parsed_event.service,
+        parsed_event.resource_type,
+        parsed_event.region,
+        parsed_event.user_arn,
+        frozenset(_get_additional_tags(event).items()),
+    )
+
+
+def _group_events(events: Iterable[Dict[str, Any]]) -> Tuple[Dict[Tuple, List[str]], int]:
+    """Parse events as they stream in and merge their resource IDs by tagging group."""
+    groups = defaultdict(list)
+    events_processed = 0
+    # Bound once outside the loop; this runs for every record in the log file.
+    parse_event = CloudTrailParser.parse_event
+    for events_processed, event in enumerate(events, 1):
+        parsed_event = parse_event(event)
+        if parsed_event:
+            groups[_group_key(parsed_event, event)].extend(parsed_event.resource_ids)
+    return groups, events_processed
+
+
+def _tag_group(
+    group_key: Tuple,
+    resource_ids: List[str],
+    created_date: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Tag all resources of one group with a single TagManager call."""
+    service, resource_type, resource_region, user_arn, additional_tags = group_key
     
-    logger.info(f"Tagging {service} resources in {resource_region}")
+    logger.debug("Tagging %s resources in %s", service, resource_region)
     
-    lambda_region = os.environ.get("AWS_REGION", "us-east-1")
-    tag_manager = TagManager(region=lambda_region)
+    tag_manager = _get_tag_manager()
     
     tagged_resources, failed_resources = tag_manager.tag_resource(
         service=service,
@@ -77,15 +127,16 @@ def process_single_event(event: Dict[str, Any]) -> Dict[str, Any]:
         resource_ids=resource_ids,
         user_arn=user_arn,
         region=resource_region,
-        additional_tags=_get_additional_tags(event)
+        additional_tags=dict(additional_tags),
+        created_date=created_date,
     )
     
     if failed_resources:
-        logger.warning(f"Failed: {len(failed_resources)} resources")
+        logger.warning("Failed: %d resources", len(failed_resources))
     
     return {
-        "event_name": parsed_event["event_name"],
         "service": service,
+        "resource_type": resource_type,
         "resource_region": resource_region,
         "tagged_count": len(tagged_resources),
         "failed_count": len(failed_resources),
@@ -93,15 +144,27 @@ def process_single_event(event: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _get_tag_manager() -> TagManager:
+    """Return the container-wide TagManager, creating it on first use."""
+    global _TAG_MANAGER
+    if _TAG_MANAGER is None:
+        _TAG_MANAGER = TagManager(region=_LAMBDA_REGION)
+    return _TAG_MANAGER
+
+
+def _get_s3_processor() -> S3CloudTrailProcessor:
+    """Return the container-wide S3CloudTrailProcessor, creating it on first use."""
+    global _S3_PROCESSOR
+    if _S3_PROCESSOR is None:
+        _S3_PROCESSOR = S3CloudTrailProcessor()
+    return _S3_PROCESSOR
+
+
 def _get_additional_tags(event: Dict[str, Any]) -> Dict[str, str]:
     """Extract additional tags from CloudTrail event."""
-    tags = {}
+    tags = dict(_BASE_TAGS)
     detail = event.get("detail", {})
     
-    env = os.environ.get("ENVIRONMENT")
-    if env:
-        tags["Environment"] = env
-    
     source_ip = detail.get("sourceIPAddress")
     if source_ip:
         tags["SourceIP"] = source_ip
@@ -1,44 +1,108 @@
 """S3 CloudTrail log processor."""
 
-import json
-import gzip
+import functools
+import itertools
 import logging
-from typing import Dict, List, Any, Optional
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Any
 import boto3
-from io import BytesIO
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from cloudtrail_parser import SUPPORTED_EVENTS
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# isal's igzip is a drop-in, SIMD-accelerated replacement for the stdlib gzip module.
+try:
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# S3 GETs of small log files are latency-bound; the shared client is thread-safe.
+# The client's connection pool is sized to match so workers never wait on it.
+MAX_DOWNLOAD_WORKERS = 16
+
+# Compressed size above which a log file is parsed record by record (CloudTrail gzips ~10:1).
+STREAMING_THRESHOLD_BYTES = 2 * 1024 * 1024
+
+_DETAIL_TYPE = "AWS API Call via CloudTrail"
+
+
+@functools.lru_cache(maxsize=None)
+def _event_source(cloudtrail_event_source: str) -> str:
+    """Map a CloudTrail eventSource (ec2.amazonaws.com) to an EventBridge source (aws.ec2)."""
+    return f"aws.{cloudtrail_event_source.partition('.')[0]}"
+
 
 class S3CloudTrailProcessor:
     """Process CloudTrail logs from S3."""
     
+    __slots__ = ('s3_client',)
+    
     def __init__(self):
-        self.s3_client = boto3.client('s3')
+        self.s3_client = boto3.client(
+            's3',
+            config=Config(
+                max_pool_connections=MAX_DOWNLOAD_WORKERS,
+                retries={'max_attempts': 3, 'mode': 'standard'},
+            ),
+        )
     
-    def process_s3_event(self, s3_event: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Extract CloudTrail events from S3 log files."""
-        cloudtrail_events = []
-        
+    def process_s3_event(self, s3_event: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield CloudTrail events from S3 log files, in order.
+
+        Up to MAX_DOWNLOAD_WORKERS files are downloaded concurrently, and at most that
+        many files' filtered records are held in memory at once.
+        """
+        log_objects = []
         for record in s3_event.get('Records', []):
             try:
-                bucket = record['s3']['bucket']['name']
-                key = record['s3']['object']['key']
-                events = self._download_and_parse_log(bucket, key)
-                cloudtrail_events.extend(events)
+                log_objects.append((record['s3']['bucket']['name'], record['s3']['object']['key']))
             except Exception as e:
                 logger.error(f"S3 processing error: {str(e)}")
                 continue
         
-        return cloudtrail_events
+        if not log_objects:
+            return
+        
+        workers = min(MAX_DOWNLOAD_WORKERS, len(log_objects))
+        remaining = iter(log_objects)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Keep at most `workers` files in flight so only that many filtered record
+            # lists are held at once; a new download starts as each file is consumed.
+            pending = deque(
+                executor.submit(self._download_and_parse_log, *log_object)
+                for log_object in itertools.islice(remaining, workers)
+            )
+            while pending:
+                events = pending.popleft().result()
+                log_object = next(remaining, None)
+                if log_object is not None:
+                    pending.append(executor.submit(self._download_and_parse_log, *log_object))
+                yield from events
     
     def _download_and_parse_log(self, bucket: str, key: str) -> List[Dict[str, Any]]:
         """Download and parse CloudTrail log file."""
         try:
             response = self.s3_client.get_object(Bucket=bucket, Key=key)
-            with gzip.GzipFile(fileobj=BytesIO(response['Body'].read())) as gzipfile:
-                log_data = json.loads(gzipfile.read())
+            # Decompress straight off the response stream; the compressed body is never buffered whole.
+            with gzip.GzipFile(fileobj=response['Body']) as gzipfile:
+                if ijson is not None and response.get('ContentLength', 0) > STREAMING_THRESHOLD_BYTES:
+                    # Only matching records are kept; the rest are dropped as they are parsed.
+                    records = ijson.items(gzipfile, 'Records.item', use_float=True)
+                    return self._filter_creation_events(records)
+                log_data = _json.loads(gzipfile.read())
             
             records = log_data.get('Records', [])
             return self._filter_creation_events(records)
@@ -47,45 +111,41 @@ class S3CloudTrailProcessor:
             logger.error(f"Log parse error: {str(e)}")
             return []
     
-    def _filter_creation_events(self, records: List[Dict]) -> List[Dict]:
+    def _filter_creation_events(self, records: Iterable[Dict]) -> List[Dict]:
         """Filter for resource creation events."""
-        CREATION_EVENTS = {
-            "RunInstances", "CreateVolume", "CreateSnapshot", "CreateSecurityGroup",
-            "CreateBucket", "CreateDBInstance", "CreateDBCluster", "CreateFunction",
-            "CreateTable", "CreateTopic", "CreateQueue"
-        }
-        
         filtered = []
         for record in records:
-            event_name = record.get('eventName')
-            if event_name in CREATION_EVENTS and not record.get('errorCode'):
-                event = self._convert_to_eventbridge_format(record)
-                if event:
-                    filtered.append(event)
+            # CloudTrail always sets eventName and only adds errorCode to failed calls.
+            try:
+                event_name = record['eventName']
+            except KeyError:
+                continue
+            if event_name in SUPPORTED_EVENTS and 'errorCode' not in record:
+                # Convert to the EventBridge "AWS API Call via CloudTrail" shape.
+                filtered.append({
+                    "version": "0",
+                    "id": record.get('eventID'),
+                    "detail-type": _DETAIL_TYPE,
+                    "source": _event_source(record.get('eventSource', '')),
+                    "account": record.get('recipientAccountId'),
+                    "time": record.get('eventTime'),
+                    "region": record.get('awsRegion'),
+                    "detail": record
+                })
         
         return filtered
     
-    def _convert_to_eventbridge_format(self, cloudtrail_record: Dict) -> Optional[Dict]:
-        """Convert CloudTrail record to standardized format."""
-        try:
-            return {
-                "version": "0",
-                "id": cloudtrail_record.get('eventID'),
-                "detail-type": "AWS API Call via CloudTrail",
-                "source": f"aws.{cloudtrail_record.get('eventSource', '').split('.')[0]}",
-                "account": cloudtrail_record.get('recipientAccountId'),
-                "time": cloudtrail_record.get('eventTime'),
-                "region": cloudtrail_record.get('awsRegion'),
-                "detail": cloudtrail_record
-            }
-        except Exception as e:
-            logger.error(f"Conversion error: {str(e)}")
-            return None
-    
     @staticmethod
     def is_s3_event(event: Dict) -> bool:
         """Check if event is from S3."""
-        if 'Records' in event:
-            return any('s3' in record for record in event['Records'])
-        return False
+        records = event.get('Records')
+        if not records:
+            return False
+        
+        # Lambda event sources tag each record, so the first one decides the common case.
+        event_source = records[0].get('eventSource')
+        if event_source is not None:
+            return event_source == 'aws:s3'
+        
+        return any('s3' in record for record in records)
 
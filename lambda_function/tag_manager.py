@@ -1,18 +1,146 @@
 """Tag manager for AWS resources."""
 
+import functools
 import logging
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple, Optional
 import boto3
-from botocore.exceptions import ClientError
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Per-resource tagging APIs without a batch form are fanned out over this pool.
+MAX_TAG_WORKERS = 16
+_TAG_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_TAG_WORKERS)
+
+# Pool sized with headroom above MAX_TAG_WORKERS for callers tagging several groups
+# at once; adaptive retries back off client-side when the tagging APIs throttle.
+_BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 10},
+    connect_timeout=3,
+    read_timeout=10,
+)
+_CLIENT_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(service: str, region: str):
+    """Create a boto3 client; cached per (service, region) for the container's lifetime."""
+    # boto3 client creation is not thread-safe; tagging runs on worker threads.
+    with _CLIENT_LOCK:
+        return boto3.client(service, region_name=region, config=_BOTO_CONFIG)
+
+
+# Successful (service, resource_type, region, resource_id, user_arn) tags are remembered
+# briefly so that redelivered CloudTrail events don't re-issue the same tagging calls.
+# Resource names are only unique per region and, for RDS, per type (db vs cluster).
+DEDUP_TTL_SECONDS = 60
+_DEDUP_MAX_ENTRIES = 4096
+_RECENTLY_TAGGED: "OrderedDict[Tuple[str, str, str, str, str], float]" = OrderedDict()
+_DEDUP_LOCK = threading.Lock()
+
+
+def _split_recently_tagged(
+    service: str,
+    resource_type: str,
+    region: str,
+    resource_ids: List[str],
+    user_arn: str,
+) -> Tuple[List[str], List[str]]:
+    """Split resource IDs into (tagged within the TTL, still to tag)."""
+    now = time.monotonic()
+    recent, pending = [], []
+    with _DEDUP_LOCK:
+        for resource_id in resource_ids:
+            tagged_at = _RECENTLY_TAGGED.get((service, resource_type, region, resource_id, user_arn))
+            if tagged_at is not None and now - tagged_at < DEDUP_TTL_SECONDS:
+                recent.append(resource_id)
+            else:
+                pending.append(resource_id)
+    return recent, pending
+
+
+def _remember_tagged(
+    service: str,
+    resource_type: str,
+    region: str,
+    resource_ids: List[str],
+    user_arn: str,
+) -> None:
+    """Record successful tags, evicting the oldest entries past _DEDUP_MAX_ENTRIES."""
+    now = time.monotonic()
+    with _DEDUP_LOCK:
+        for resource_id in resource_ids:
+            key = (service, resource_type, region, resource_id, user_arn)
+            _RECENTLY_TAGGED[key] = now
+            _RECENTLY_TAGGED.move_to_end(key)
+        while len(_RECENTLY_TAGGED) > _DEDUP_MAX_ENTRIES:
+            _RECENTLY_TAGGED.popitem(last=False)
+
+
+def _is_bad_ec2_id_error(error_code: str) -> bool:
+    """Whether a CreateTags error names a bad resource ID, so bisecting can isolate it."""
+    return error_code == "InvalidID" or error_code.endswith((".NotFound", ".Malformed"))
+
+
+def created_date_now() -> str:
+    """Return the current UTC time in the CreatedDate tag format, e.g. 2024-01-15T10:30:00Z."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+# Placeholder for the per-call CreatedDate in cached tag templates.
+_CREATED_DATE = object()
+
+
+@functools.lru_cache(maxsize=128)
+def _tag_template(user_arn: str, additional_items: Optional[Tuple[Tuple[str, str], ...]]) -> Tuple:
+    """Return the ordered tag items for a creator, with CreatedDate left as a placeholder."""
+    tags = {
+        "CreatedBy": user_arn,
+        "CreatedDate": _CREATED_DATE,
+        "ManagedBy": "auto-tagger",
+    }
+    if additional_items:
+        tags.update(additional_items)
+    return tuple(tags.items())
+
+
+@dataclass(slots=True)
+class FailedResource:
+    """A resource that could not be tagged and the reason why."""
+
+    resource_id: str
+    error: str
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"resource_id": self.resource_id, "error": self.error}
+
+
+class TagBundle(NamedTuple):
+    """Tags in both shapes used by the tagging APIs."""
+
+    tags: Dict[str, str]
+    tag_list: List[Dict[str, str]]
+
 
 class TagManager:
     """Manages tagging across AWS services."""
 
+    __slots__ = (
+        "default_region",
+        "tagged_resources",
+        "failed_resources",
+        "_account_id",
+    )
+
     SUPPORTED_SERVICES = {
         "ec2": {
             "client": "ec2",
@@ -44,19 +172,52 @@ class TagManager:
         },
     }
 
+    # service -> unbound tag method, built from SUPPORTED_SERVICES after the class body.
+    TAG_DISPATCH: Dict[str, Callable] = {}
+
+    # CreateTags accepts up to 1000 resource IDs per call.
+    EC2_TAG_BATCH_SIZE = 1000
+
+    # Resource Groups Tagging API TagResources accepts up to 20 ARNs per call.
+    RGT_TAG_BATCH_SIZE = 20
+
     def __init__(self, region: str = "us-east-1"):
         self.default_region = region
-        self.clients = {}
+        self._account_id = None
         self.tagged_resources = []
         self.failed_resources = []
 
+    @staticmethod
+    def preload(services: Iterable[str] = ("ec2", "s3"), region: str = "us-east-1") -> None:
+        """Build clients ahead of time, e.g. during Lambda's init phase.
+
+        Other clients are still created lazily on first use.
+        """
+        for service in services:
+            _get_client(service, region)
+
     def _get_client(self, service: str, region: str = None):
         """Get or create boto3 client."""
-        region = region or self.default_region
-        client_key = f"{service}_{region}"
-        if client_key not in self.clients:
-            self.clients[client_key] = boto3.client(service, region_name=region)
-        return self.clients[client_key]
+        return _get_client(service, region or self.default_region)
+
+    @staticmethod
+    def _arn_owner(arn: Optional[str]) -> Tuple[str, Optional[str]]:
+        """Return (partition, account ID) of an ARN.
+
+        Principals without an ARN give ("aws", None): the commercial partition, with the
+        account left to STS.
+        """
+        if arn and arn.startswith("arn:"):
+            parts = arn.split(":", 5)
+            if len(parts) > 4 and parts[1] and parts[4]:
+                return parts[1], parts[4]
+        return "aws", None
+
+    def _get_account_id(self) -> str:
+        """Get the caller's account ID, resolved through STS once per instance."""
+        if self._account_id is None:
+            self._account_id = self._get_client("sts").get_caller_identity()["Account"]
+        return self._account_id
 
     def tag_resource(
         self,
@@ -66,232 +227,284 @@ class TagManager:
         user_arn: str,
         region: str = None,
         additional_tags: Optional[Dict[str, str]] = None,
-    ) -> Tuple[List[str], List[Dict]]:
-        """Tag resources with creator information."""
-        if service not in self.SUPPORTED_SERVICES:
-            return [], [{"resource_id": rid, "error": "Unsupported service"} for rid in resource_ids]
+        created_date: Optional[str] = None,
+    ) -> Tuple[List[str], List[FailedResource]]:
+        """Tag resources with creator information.
+
+        created_date lets a caller stamp several tag_resource calls with one CreatedDate.
+        """
+        method = self.TAG_DISPATCH.get(service)
+        if method is None:
+            return [], [FailedResource(rid, "Unsupported service") for rid in resource_ids]
+
+        region = region or self.default_region
+        # A record redelivered within one batch repeats its IDs; tag each only once.
+        resource_ids = list(dict.fromkeys(resource_ids))
+        recently_tagged, resource_ids = _split_recently_tagged(service, resource_type, region, resource_ids, user_arn)
+        if not resource_ids:
+            logger.info("Skipped %d %s resources tagged within %ds", len(recently_tagged), service, DEDUP_TTL_SECONDS)
+            return recently_tagged, []
 
         try:
-            method_name = self.SUPPORTED_SERVICES[service]["tag_method"]
-            method = getattr(self, method_name, None)
-            if not method:
-                return [], [{"resource_id": rid, "error": "Method not found"} for rid in resource_ids]
-            
-            return method(resource_ids, user_arn, resource_type, region, additional_tags)
+            # Built once per call so every resource shares the same tags and CreatedDate.
+            tag_bundle = self._build_tags(user_arn, additional_tags, created_date)
+            # The creator's ARN names the partition and account the resources live in;
+            # STS is only the fallback.
+            partition, account_id = self._arn_owner(user_arn)
+            tagged, failed = method(self, resource_ids, resource_type, tag_bundle, region, account_id, partition)
             
+        except (AttributeError, TypeError) as e:
+            # A bug in this module (e.g. a misspelled boto3 method), not an AWS error;
+            # log the traceback so it doesn't pass for an ordinary tagging failure.
+            logger.exception("Tagging bug for %s: %s", service, e)
+            return [], [FailedResource(rid, f"Internal error: {str(e)}") for rid in resource_ids]
         except Exception as e:
-            logger.error(f"Tagging error: {str(e)}")
-            return [], [{"resource_id": rid, "error": str(e)} for rid in resource_ids]
-
-    def _build_tags(self, user_arn: str, additional_tags: Optional[Dict] = None) -> Dict[str, str]:
-        """Build tag dictionary."""
-        tags = {
-            "CreatedBy": user_arn,
-            "CreatedDate": datetime.utcnow().isoformat(),
-            "ManagedBy": "auto-tagger",
-        }
-        if additional_tags:
-            tags.update(additional_tags)
-        return tags
+            logger.error("Tagging error: %s", e)
+            return [], [FailedResource(rid, str(e)) for rid in resource_ids]
+        
+        _remember_tagged(service, resource_type, region, tagged, user_arn)
+        
+        # One summary line per call rather than one per resource.
+        logger.info(
+            "Tagged %d %s resources (%d failed, %d skipped as recently tagged)",
+            len(tagged), service, len(failed), len(recently_tagged),
+        )
+        return recently_tagged + tagged, failed
+
+    def _build_tags(
+        self,
+        user_arn: str,
+        additional_tags: Optional[Dict] = None,
+        created_date: Optional[str] = None,
+    ) -> TagBundle:
+        """Build tags as a dict and as the Key/Value list most AWS APIs take."""
+        created_date = created_date or created_date_now()
+        template = _tag_template(user_arn, tuple(additional_tags.items()) if additional_tags else None)
+        tags = {k: created_date if v is _CREATED_DATE else v for k, v in template}
+        return TagBundle(tags, [{"Key": k, "Value": v} for k, v in tags.items()])
+
+    def _tag_via_rgt(
+        self,
+        arns: Dict[str, str],
+        tags: Dict[str, str],
+        region: str = None,
+    ) -> Tuple[List[str], List[FailedResource]]:
+        """Tag resources by ARN through the Resource Groups Tagging API.
+
+        arns maps each resource ID to its ARN; results are reported by resource ID.
+        """
+        client = self._get_client("resourcegroupstaggingapi", region)
+        batches = list(arns.items())
+        
+        tagged, failed = [], []
+        for start in range(0, len(batches), self.RGT_TAG_BATCH_SIZE):
+            batch = batches[start:start + self.RGT_TAG_BATCH_SIZE]
+            try:
+                response = client.tag_resources(ResourceARNList=[arn for _, arn in batch], Tags=tags)
+            except ClientError as e:
+                error_code = e.response["Error"]["Code"]
+                error_msg = e.response["Error"]["Message"]
+                logger.error("Failed to tag %d resources: %s", len(batch), error_msg)
+                failed.extend(FailedResource(rid, f"{error_code}: {error_msg}") for rid, _ in batch)
+                continue
+            
+            failures = response.get("FailedResourcesMap", {})
+            for resource_id, arn in batch:
+                failure = failures.get(arn)
+                if failure is None:
+                    tagged.append(resource_id)
+                else:
+                    error_msg = failure.get("ErrorMessage")
+                    logger.error("Failed to tag '%s': %s", arn, error_msg)
+                    failed.append(FailedResource(resource_id, f"{failure.get('ErrorCode')}: {error_msg}"))
+        
+        return tagged, failed
+
+    def _concurrent_tag(
+        self,
+        resource_ids: List[str],
+        tag_one: Callable[[str], Optional[FailedResource]],
+    ) -> Tuple[List[str], List[FailedResource]]:
+        """Run tag_one for each resource concurrently; it returns a FailedResource or None."""
+        if len(resource_ids) == 1:
+            # The common single-resource event; skip the hand-off to the pool.
+            failure = tag_one(resource_ids[0])
+            return (list(resource_ids), []) if failure is None else ([], [failure])
+        
+        tagged, failed = [], []
+        for resource_id, failure in zip(resource_ids, _TAG_EXECUTOR.map(tag_one, resource_ids)):
+            if failure is None:
+                tagged.append(resource_id)
+            else:
+                failed.append(failure)
+        return tagged, failed
 
     def _tag_ec2_resource(
         self,
         resource_ids: List[str],
-        user_arn: str,
         resource_type: str,
+        tag_bundle: TagBundle,
         region: str = None,
-        additional_tags: Optional[Dict] = None,
-    ) -> Tuple[List[str], List[Dict]]:
+        account_id: str = None,
+        partition: str = "aws",
+    ) -> Tuple[List[str], List[FailedResource]]:
         client = self._get_client("ec2", region)
-        tags = self._build_tags(user_arn, additional_tags)
-        tag_list = [{"Key": k, "Value": v} for k, v in tags.items()]
         
         tagged, failed = [], []
-        for resource_id in resource_ids:
-            try:
-                client.create_tags(Resources=[resource_id], Tags=tag_list)
-                tagged.append(resource_id)
-            except ClientError as e:
-                failed.append({"resource_id": resource_id, "error": e.response["Error"]["Code"]})
+        for start in range(0, len(resource_ids), self.EC2_TAG_BATCH_SIZE):
+            batch = resource_ids[start:start + self.EC2_TAG_BATCH_SIZE]
+            self._create_ec2_tags(client, batch, tag_bundle.tag_list, tagged, failed)
         
         return tagged, failed
 
+    def _create_ec2_tags(
+        self,
+        client,
+        resource_ids: List[str],
+        tag_list: List[Dict[str, str]],
+        tagged: List[str],
+        failed: List[FailedResource],
+    ) -> None:
+        """Tag a batch in one call; on failure, bisect it to isolate the rejected IDs."""
+        try:
+            client.create_tags(Resources=resource_ids, Tags=tag_list)
+            tagged.extend(resource_ids)
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if len(resource_ids) == 1 or not _is_bad_ec2_id_error(error_code):
+                # Errors that don't point at an ID (auth, throttling) fail the whole batch.
+                failed.extend(FailedResource(rid, error_code) for rid in resource_ids)
+                return
+            middle = len(resource_ids) // 2
+            self._create_ec2_tags(client, resource_ids[:middle], tag_list, tagged, failed)
+            self._create_ec2_tags(client, resource_ids[middle:], tag_list, tagged, failed)
+
     def _tag_s3_resource(
         self,
         resource_ids: List[str],
-        user_arn: str,
         resource_type: str,
+        tag_bundle: TagBundle,
         region: str = None,
-        additional_tags: Optional[Dict] = None,
-    ) -> Tuple[List[str], List[Dict]]:
+        account_id: str = None,
+        partition: str = "aws",
+    ) -> Tuple[List[str], List[FailedResource]]:
         client = self._get_client("s3", region)
-        tags = self._build_tags(user_arn, additional_tags)
-        tag_set = {"TagSet": [{"Key": k, "Value": v} for k, v in tags.items()]}
+        tag_set = {"TagSet": tag_bundle.tag_list}
         
-        tagged, failed = [], []
-        for bucket_name in resource_ids:
+        def tag_one(bucket_name: str) -> Optional[FailedResource]:
             try:
                 client.put_bucket_tagging(Bucket=bucket_name, Tagging=tag_set)
-                tagged.append(bucket_name)
+                return None
             except ClientError as e:
-                failed.append({"resource_id": bucket_name, "error": e.response["Error"]["Code"]})
+                return FailedResource(bucket_name, e.response["Error"]["Code"])
         
-        return tagged, failed
+        return self._concurrent_tag(resource_ids, tag_one)
 
     def _tag_rds_resource(
         self,
         resource_ids: List[str],
-        user_arn: str,
         resource_type: str,
+        tag_bundle: TagBundle,
         region: str = None,
-        additional_tags: Optional[Dict] = None,
-    ) -> Tuple[List[str], List[Dict]]:
+        account_id: str = None,
+        partition: str = "aws",
+    ) -> Tuple[List[str], List[FailedResource]]:
         """Tag RDS resources (DB instances, clusters)"""
-        if region is None:
-            region = self.default_region
-        client = self._get_client("rds", region)
-        tags = self._build_tags(user_arn, additional_tags)
-        
-        # Convert to RDS tag format
-        tag_list = [{"Key": k, "Value": v} for k, v in tags.items()]
-        
-        tagged = []
-        failed = []
+        region = region or self.default_region
+        account_id = account_id or self._get_account_id()
         
+        arns = {}
         for resource_id in resource_ids:
-            try:
-                # Build ARN based on resource type
-                if resource_type == "db":
-                    arn = f"arn:aws:rds:{region}:*:db:{resource_id}"
-                elif resource_type == "cluster":
-                    arn = f"arn:aws:rds:{region}:*:cluster:{resource_id}"
-                else:
-                    arn = resource_id
-                
-                client.add_tags_to_resource(ResourceName=arn, Tags=tag_list)
-                tagged.append(resource_id)
-            except ClientError as e:
-                error_code = e.response["Error"]["Code"]
-                error_msg = e.response["Error"]["Message"]
-                failed.append({"resource_id": resource_id, "error": f"{error_code}: {error_msg}"})
+            # Build ARN based on resource type
+            if resource_type in ("db", "cluster"):
+                arns[resource_id] = f"arn:{partition}:rds:{region}:{account_id}:{resource_type}:{resource_id}"
+            else:
+                arns[resource_id] = resource_id
         
-        return tagged, failed
+        return self._tag_via_rgt(arns, tag_bundle.tags, region)
 
     def _tag_lambda_resource(
         self,
         resource_ids: List[str],
-        user_arn: str,
         resource_type: str,
+        tag_bundle: TagBundle,
         region: str = None,
-        additional_tags: Optional[Dict] = None,
-    ) -> Tuple[List[str], List[Dict]]:
+        account_id: str = None,
+        partition: str = "aws",
+    ) -> Tuple[List[str], List[FailedResource]]:
         """Tag Lambda functions"""
-        client = self._get_client("lambda", region)
-        tags = self._build_tags(user_arn, additional_tags)
-        
-        tagged = []
-        failed = []
-        
-        for function_name in resource_ids:
-            try:
-                client.tag_resource(Resource=function_name, Tags=tags)
-                tagged.append(function_name)
-            except ClientError as e:
-                error_code = e.response["Error"]["Code"]
-                error_msg = e.response["Error"]["Message"]
-                failed.append({"resource_id": function_name, "error": f"{error_code}: {error_msg}"})
-                logger.error(f"Failed to tag Lambda function '{function_name}': {error_msg}")
+        region = region or self.default_region
+        account_id = account_id or self._get_account_id()
         
-        return tagged, failed
+        arns = {
+            function_name: function_name if function_name.startswith("arn:")
+            else f"arn:{partition}:lambda:{region}:{account_id}:function:{function_name}"
+            for function_name in resource_ids
+        }
+        return self._tag_via_rgt(arns, tag_bundle.tags, region)
 
     def _tag_dynamodb_resource(
         self,
         resource_ids: List[str],
-        user_arn: str,
         resource_type: str,
+        tag_bundle: TagBundle,
         region: str = None,
-        additional_tags: Optional[Dict] = None,
-    ) -> Tuple[List[str], List[Dict]]:
+        account_id: str = None,
+        partition: str = "aws",
+    ) -> Tuple[List[str], List[FailedResource]]:
         """Tag DynamoDB tables"""
-        client = self._get_client("dynamodb", region)
-        tags = self._build_tags(user_arn, additional_tags)
-        
-        # Convert to DynamoDB tag format
-        tag_list = [{"Key": k, "Value": v} for k, v in tags.items()]
-        
-        tagged = []
-        failed = []
-        
-        for table_name in resource_ids:
-            try:
-                # Get table ARN
-                response = client.describe_table(TableName=table_name)
-                table_arn = response["Table"]["TableArn"]
-                
-                client.tag_resource(ResourceArn=table_arn, Tags=tag_list)
-                tagged.append(table_name)
-            except ClientError as e:
-                error_code = e.response["Error"]["Code"]
-                error_msg = e.response["Error"]["Message"]
-                failed.append({"resource_id": table_name, "error": f"{error_code}: {error_msg}"})
-                logger.error(f"Failed to tag DynamoDB table '{table_name}': {error_msg}")
+        region = region or self.default_region
+        account_id = account_id or self._get_account_id()
         
-        return tagged, failed
+        arns = {
+            table_name: f"arn:{partition}:dynamodb:{region}:{account_id}:table/{table_name}"
+            for table_name in resource_ids
+        }
+        return self._tag_via_rgt(arns, tag_bundle.tags, region)
 
     def _tag_sns_resource(
         self,
         resource_ids: List[str],
-        user_arn: str,
         resource_type: str,
+        tag_bundle: TagBundle,
         region: str = None,
-        additional_tags: Optional[Dict] = None,
-    ) -> Tuple[List[str], List[Dict]]:
+        account_id: str = None,
+        partition: str = "aws",
+    ) -> Tuple[List[str], List[FailedResource]]:
         """Tag SNS topics"""
-        client = self._get_client("sns", region)
-        tags = self._build_tags(user_arn, additional_tags)
-        
-        # Convert to SNS tag format
-        tag_list = [{"Key": k, "Value": v} for k, v in tags.items()]
-        
-        tagged = []
-        failed = []
-        
-        for topic_arn in resource_ids:
-            try:
-                client.tag_resource(ResourceArn=topic_arn, Tags=tag_list)
-                tagged.append(topic_arn)
-            except ClientError as e:
-                error_code = e.response["Error"]["Code"]
-                error_msg = e.response["Error"]["Message"]
-                failed.append({"resource_id": topic_arn, "error": f"{error_code}: {error_msg}"})
-                logger.error(f"Failed to tag SNS topic '{topic_arn}': {error_msg}")
-        
-        return tagged, failed
+        # CreateTopic already reports the topic ARN.
+        arns = {topic_arn: topic_arn for topic_arn in resource_ids}
+        return self._tag_via_rgt(arns, tag_bundle.tags, region)
 
     def _tag_sqs_resource(
         self,
         resource_ids: List[str],
-        user_arn: str,
         resource_type: str,
+        tag_bundle: TagBundle,
         region: str = None,
-        additional_tags: Optional[Dict] = None,
-    ) -> Tuple[List[str], List[Dict]]:
+        account_id: str = None,
+        partition: str = "aws",
+    ) -> Tuple[List[str], List[FailedResource]]:
         """Tag SQS queues"""
         client = self._get_client("sqs", region)
-        tags = self._build_tags(user_arn, additional_tags)
-        
-        tagged = []
-        failed = []
         
-        for queue_url in resource_ids:
+        def tag_one(queue_url: str) -> Optional[FailedResource]:
             try:
-                client.tag_queue_async(QueueUrl=queue_url, Tags=tags)
-                tagged.append(queue_url)
+                client.tag_queue(QueueUrl=queue_url, Tags=tag_bundle.tags)
+                return None
             except ClientError as e:
                 error_code = e.response["Error"]["Code"]
                 error_msg = e.response["Error"]["Message"]
-                failed.append({"resource_id": queue_url, "error": f"{error_code}: {error_msg}"})
-                logger.error(f"Failed to tag SQS queue '{queue_url}': {error_msg}")
+                logger.error("Failed to tag SQS queue '%s': %s", queue_url, error_msg)
+                return FailedResource(queue_url, f"{error_code}: {error_msg}")
+            except BotoCoreError as e:
+                logger.error("Failed to tag SQS queue '%s': %s", queue_url, e)
+                return FailedResource(queue_url, str(e))
         
-        return tagged, failed
+        return self._concurrent_tag(resource_ids, tag_one)
+
 
+TagManager.TAG_DISPATCH = {
+    service: getattr(TagManager, config["tag_method"])
+    for service, config in TagManager.SUPPORTED_SERVICES.items()
+}
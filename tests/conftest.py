@@ -0,0 +1,6 @@
+"""Shared pytest setup: the Lambda modules import each other as top-level modules."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lambda_function"))
@@ -0,0 +1,90 @@
+"""Tests for TagManager's skip of recently tagged resources."""
+
+import boto3
+import pytest
+from botocore.stub import ANY, Stubber
+
+import tag_manager
+from tag_manager import TagManager
+
+USER_ARN = "arn:aws:iam::123456789012:user/alice"
+
+
+@pytest.fixture
+def rgt_stub(monkeypatch):
+    """Route every TagManager client to one stubbed Resource Groups Tagging API client."""
+    client = boto3.client(
+        "resourcegroupstaggingapi",
+        region_name="us-east-1",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+    )
+    monkeypatch.setattr(tag_manager, "_get_client", lambda service, region: client)
+    tag_manager._RECENTLY_TAGGED.clear()
+    with Stubber(client) as stubber:
+        yield stubber
+        stubber.assert_no_pending_responses()
+    tag_manager._RECENTLY_TAGGED.clear()
+
+
+def expect_tag_resources(stubber, arns):
+    stubber.add_response(
+        "tag_resources",
+        {"FailedResourcesMap": {}},
+        {"ResourceARNList": arns, "Tags": ANY},
+    )
+
+
+def test_repeat_call_within_ttl_is_skipped(rgt_stub):
+    expect_tag_resources(rgt_stub, ["arn:aws:rds:us-east-1:123456789012:db:mydb"])
+    manager = TagManager()
+
+    assert manager.tag_resource("rds", "db", ["mydb"], USER_ARN) == (["mydb"], [])
+    # No second response is queued, so a second TagResources call would fail the stubber.
+    assert manager.tag_resource("rds", "db", ["mydb"], USER_ARN) == (["mydb"], [])
+
+
+def test_repeat_call_after_ttl_is_tagged_again(rgt_stub, monkeypatch):
+    arn = "arn:aws:rds:us-east-1:123456789012:db:mydb"
+    expect_tag_resources(rgt_stub, [arn])
+    expect_tag_resources(rgt_stub, [arn])
+    now = [1000.0]
+    monkeypatch.setattr(tag_manager.time, "monotonic", lambda: now[0])
+    manager = TagManager()
+
+    manager.tag_resource("rds", "db", ["mydb"], USER_ARN)
+    now[0] += tag_manager.DEDUP_TTL_SECONDS + 1
+    assert manager.tag_resource("rds", "db", ["mydb"], USER_ARN) == (["mydb"], [])
+
+
+def test_same_name_with_other_resource_type_is_tagged(rgt_stub):
+    expect_tag_resources(rgt_stub, ["arn:aws:rds:us-east-1:123456789012:cluster:mydb"])
+    expect_tag_resources(rgt_stub, ["arn:aws:rds:us-east-1:123456789012:db:mydb"])
+    manager = TagManager()
+
+    assert manager.tag_resource("rds", "cluster", ["mydb"], USER_ARN) == (["mydb"], [])
+    assert manager.tag_resource("rds", "db", ["mydb"], USER_ARN) == (["mydb"], [])
+
+
+def test_same_name_in_other_region_is_tagged(rgt_stub):
+    expect_tag_resources(rgt_stub, ["arn:aws:dynamodb:us-east-1:123456789012:table/orders"])
+    expect_tag_resources(rgt_stub, ["arn:aws:dynamodb:eu-west-1:123456789012:table/orders"])
+    manager = TagManager()
+
+    manager.tag_resource("dynamodb", "table", ["orders"], USER_ARN, region="us-east-1")
+    assert manager.tag_resource("dynamodb", "table", ["orders"], USER_ARN, region="eu-west-1") == (["orders"], [])
+
+
+def test_failed_resources_are_not_remembered(rgt_stub):
+    arn = "arn:aws:dynamodb:us-east-1:123456789012:table/orders"
+    rgt_stub.add_response(
+        "tag_resources",
+        {"FailedResourcesMap": {arn: {"ErrorCode": "InternalServiceException", "ErrorMessage": "try again"}}},
+        {"ResourceARNList": [arn], "Tags": ANY},
+    )
+    expect_tag_resources(rgt_stub, [arn])
+    manager = TagManager()
+
+    tagged, failed = manager.tag_resource("dynamodb", "table", ["orders"], USER_ARN)
+    assert tagged == [] and [f.resource_id for f in failed] == ["orders"]
+    assert manager.tag_resource("dynamodb", "table", ["orders"], USER_ARN) == (["orders"], [])